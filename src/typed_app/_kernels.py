@@ -0,0 +1,91 @@
+"""Low-level numeric kernels over flat row-major ``array('d')`` buffers.
+
+These are the pure-Python paths used when NumPy is unavailable (and, for
+the smallest products, always). They work directly on the flat buffers and
+push as much of each inner loop as possible into C-level builtins.
+"""
+
+from __future__ import annotations
+
+from array import array
+from math import prod
+from operator import mul
+from typing import Any, Callable
+
+
+# Largest m·k·n product handled by a generated straight-line kernel; above
+# this the generated source grows too large to be worth compiling.
+UNROLL_MAX_WORK = 64
+
+_unrolled_matmuls: dict[tuple[int, int, int], Callable[[array[float], array[float]], array[float]]] = {}
+
+
+def matmul_dot(a: array[float], b: array[float], m: int, k: int, n: int) -> array[float]:
+    """Return the product of an ``m×k`` and a ``k×n`` matrix as a new buffer.
+    
+    Pure-Python fallback for when NumPy is unavailable. Each row of ``a`` and
+    each column of ``b`` (i.e. each row of ``bᵀ``) is sliced out once as a
+    contiguous buffer, and every output element is a ``sum(map(mul, ...))``
+    dot product, so the multiply-adds run in C rather than one bytecode
+    dispatch per term.
+    """
+    a_rows = [a[start:start + k] for start in range(0, m * k, k)]
+    b_columns = [b[j::n] for j in range(n)]
+    return array("d", [sum(map(mul, a_row, b_column)) for a_row in a_rows for b_column in b_columns])
+
+
+def matmul_unrolled(m: int, k: int, n: int) -> Callable[[array[float], array[float]], array[float]]:
+    """Return a loop-free kernel multiplying an ``m×k`` by a ``k×n`` matrix.
+    
+    The kernel is generated as Python source with one sum of products per
+    output element and compiled once per shape, so small products run as
+    straight-line bytecode without ``range`` objects or per-element index
+    arithmetic. Kernels are cached by shape.
+    """
+    shape = (m, k, n)
+    kernel = _unrolled_matmuls.get(shape)
+    if kernel is None:
+        terms = (
+            " + ".join(f"a[{i * k + p}] * b[{p * n + j}]" for p in range(k)) or "0.0"
+            for i in range(m)
+            for j in range(n)
+        )
+        source = f"def matmul_{m}x{k}x{n}(a, b):\n    return array('d', [{', '.join(terms)}])\n"
+        namespace: dict[str, Any] = {"array": array}
+        exec(compile(source, f"<matmul_unrolled {m}x{k}x{n}>", "exec"), namespace)
+        kernel = _unrolled_matmuls[shape] = namespace[f"matmul_{m}x{k}x{n}"]
+    return kernel
+
+
+def determinant_gauss(flat: array[float], n: int) -> float:
+    """Return the determinant of the ``n×n`` matrix stored in ``flat``.
+    
+    Uses Gaussian elimination with partial pivoting on a single working copy
+    of the buffer: O(n³) arithmetic, with each row update done as one
+    slice assignment. The determinant is the product of the pivots, negated once per
+    row swap.
+    """
+    a = array("d", flat)
+    sign = 1.0
+    for col in range(n):
+        # Partial pivoting: use the largest remaining entry in this column
+        top = col * n
+        magnitudes = list(map(abs, a[top + col::n]))
+        pivot_row = col + magnitudes.index(max(magnitudes))
+        pivot = a[pivot_row * n + col]
+        if pivot == 0.0:
+            return 0.0
+        if pivot_row != col:
+            other = pivot_row * n
+            a[top:top + n], a[other:other + n] = a[other:other + n], a[top:top + n]
+            sign = -sign
+        
+        # The pivot row's tail is sliced out once and zipped against each
+        # row below it, so the update does no per-element index arithmetic.
+        pivot_tail = a[top + col + 1:top + n]
+        for row in range(top + n, n * n, n):
+            factor = a[row + col] / pivot
+            start, end = row + col + 1, row + n
+            a[start:end] = array("d", [x - factor * y for x, y in zip(a[start:end], pivot_tail)])
+    
+    return sign * prod(a[::n + 1])
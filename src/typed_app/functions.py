@@ -6,9 +6,15 @@ the application for common calculations, data transformations, and matrix operat
 
 from __future__ import annotations
 
+from array import array
+from math import fsum
 from typing import Iterable
 
-from .models import User, Matrix
+from ._kernels import UNROLL_MAX_WORK, determinant_gauss, matmul_dot, matmul_unrolled
+from .models import _HAS_NUMPY, User, Matrix, _ndarray_view, _zeros
+
+if _HAS_NUMPY:
+    import numpy as np
 
 
 def calculate_total(prices: Iterable[float]) -> float:
@@ -16,7 +22,9 @@ def calculate_total(prices: Iterable[float]) -> float:
     
     Takes an iterable of numeric values and returns their sum as a float.
     This function is useful for calculating totals from lists of prices,
-    amounts, or other numeric values.
+    amounts, or other numeric values. The sum is computed with ``math.fsum``,
+    which avoids accumulating rounding error; NumPy arrays of any shape are
+    flattened first and summed the same way.
     
     Args:
         prices: An iterable collection of numeric values to sum
@@ -32,10 +40,9 @@ def calculate_total(prices: Iterable[float]) -> float:
         >>> calculate_total([1.5, 2.5])
         4.0
     """
-    total = 0.0
-    for price in prices:
-        total += float(price)
-    return total
+    if _HAS_NUMPY and isinstance(prices, np.ndarray):
+        return fsum(prices.ravel())
+    return fsum(prices)
 
 
 def get_user_full_name(user: User) -> str:
@@ -64,7 +71,10 @@ def multiply_matrices(matrix1: Matrix, matrix2: Matrix) -> Matrix:
     """Multiply two matrices together.
     
     Performs standard matrix multiplication where the result is a new matrix
-    with dimensions (matrix1.rows × matrix2.cols).
+    with dimensions (matrix1.rows × matrix2.cols). Small products run through
+    a generated, fully unrolled kernel cached per shape; larger ones use
+    NumPy's BLAS-backed ``matmul`` when NumPy is installed, and row-by-column
+    dot products over a pre-transposed ``matrix2`` in pure Python otherwise.
     
     Args:
         matrix1: First matrix (left operand)
@@ -92,15 +102,17 @@ def multiply_matrices(matrix1: Matrix, matrix2: Matrix) -> Matrix:
             f"Number of columns in first matrix must equal number of rows in second matrix."
         )
     
-    result_data = []
-    for i in range(matrix1.rows):
-        row = []
-        for j in range(matrix2.cols):
-            element = sum(matrix1.data[i][k] * matrix2.data[k][j] for k in range(matrix1.cols))
-            row.append(element)
-        result_data.append(row)
+    a, b = matrix1._flat, matrix2._flat
+    rows, inner, cols = matrix1.rows, matrix1.cols, matrix2.cols
+    if rows * inner * cols <= UNROLL_MAX_WORK:
+        result = matmul_unrolled(rows, inner, cols)(a, b)
+    elif _HAS_NUMPY:
+        result = _zeros(rows * cols)
+        np.matmul(matrix1._as_ndarray(), matrix2._as_ndarray(), out=_ndarray_view(result, rows, cols))
+    else:
+        result = matmul_dot(a, b, rows, inner, cols)
     
-    return Matrix(result_data)
+    return Matrix._from_flat(result, rows, cols)
 
 
 def create_identity_matrix(size: int) -> Matrix:
@@ -129,21 +141,22 @@ def create_identity_matrix(size: int) -> Matrix:
     if size < 1:
         raise ValueError("Matrix size must be at least 1")
     
-    data = []
-    for i in range(size):
-        row = []
-        for j in range(size):
-            row.append(1.0 if i == j else 0.0)
-        data.append(row)
-    
-    return Matrix(data)
+    # Diagonal elements sit every (size + 1) positions in the flat buffer
+    flat = _zeros(size * size)
+    flat[::size + 1] = array("d", [1.0]) * size
+    return Matrix._from_flat(flat, size, size)
 
 
 def matrix_determinant(matrix: Matrix) -> float:
     """Calculate the determinant of a square matrix.
     
-    Uses the Laplace expansion method for calculating determinants.
-    Only works for square matrices.
+    Matrices up to 3x3 use the closed-form cofactor expansion. Larger ones
+    are reduced in O(n³): by LU decomposition via ``numpy.linalg.det`` when
+    NumPy is installed, and by Gaussian elimination with partial pivoting in
+    pure Python otherwise. Both are floating-point results that may differ
+    from the exact determinant in the last bits; ``numpy.linalg.det`` in
+    particular evaluates ``sign * exp(logdet)``, so even integer input need
+    not give an integral result. Only works for square matrices.
     
     Args:
         matrix: The square matrix to calculate the determinant for
@@ -163,42 +176,31 @@ def matrix_determinant(matrix: Matrix) -> float:
     if matrix.rows != matrix.cols:
         raise ValueError("Determinant can only be calculated for square matrices")
     
+    flat, n = matrix._flat, matrix.rows
+    
     # Base case: 1x1 matrix
-    if matrix.rows == 1:
-        return matrix.data[0][0]
+    if n == 1:
+        return flat[0]
     
     # Base case: 2x2 matrix
-    if matrix.rows == 2:
-        return matrix.data[0][0] * matrix.data[1][1] - matrix.data[0][1] * matrix.data[1][0]
+    if n == 2:
+        return flat[0] * flat[3] - flat[1] * flat[2]
     
-    # Recursive case: use Laplace expansion
-    determinant = 0.0
-    for col in range(matrix.cols):
-        # Create submatrix by removing first row and current column
-        submatrix_data = []
-        for i in range(1, matrix.rows):
-            row = []
-            for j in range(matrix.cols):
-                if j != col:
-                    row.append(matrix.data[i][j])
-            submatrix_data.append(row)
-        
-        submatrix = Matrix(submatrix_data)
-        cofactor = matrix.data[0][col] * matrix_determinant(submatrix)
-        
-        # Alternate signs
-        if col % 2 == 0:
-            determinant += cofactor
-        else:
-            determinant -= cofactor
+    # Base case: 3x3 matrix, expanded along the first row
+    if n == 3:
+        a, b, c, d, e, f, g, h, i = flat
+        return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
     
-    return determinant
+    if _HAS_NUMPY:
+        return float(np.linalg.det(matrix._as_ndarray()))
+    return determinant_gauss(flat, n)
 
 
 def matrix_trace(matrix: Matrix) -> float:
     """Calculate the trace of a square matrix.
     
-    The trace is the sum of elements on the main diagonal.
+    The trace is the sum of elements on the main diagonal. The diagonal is
+    gathered as a single strided slice of the flat buffer and summed in C.
     
     Args:
         matrix: The square matrix to calculate the trace for
@@ -218,4 +220,6 @@ def matrix_trace(matrix: Matrix) -> float:
     if matrix.rows != matrix.cols:
         raise ValueError("Trace can only be calculated for square matrices")
     
-    return sum(matrix.data[i][i] for i in range(matrix.rows))
+    # Diagonal elements sit every (n + 1) positions in the flat buffer
+    n = matrix.rows
+    return sum(matrix._flat[::n + 1])
@@ -75,6 +75,11 @@ def main() -> None:
     print("\n   Matrix C × 2 (Scalar Multiplication):")
     print(f"   {str(scaled_matrix).replace(chr(10), chr(10) + '   ')}")
     
+    # Fused scale-and-add
+    fused_matrix = matrix_c.axpy(matrix_d, 2)
+    print("\n   Matrix C + 2 × Matrix D (Fused axpy):")
+    print(f"   {str(fused_matrix).replace(chr(10), chr(10) + '   ')}")
+    
     # Matrix transpose
     transposed = matrix_c.transpose()
     print("\n   Matrix C Transpose:")
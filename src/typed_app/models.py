@@ -6,11 +6,31 @@ including user identification, user information models, and mathematical structu
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
-from typing import NewType
+from typing import TYPE_CHECKING, Any, NewType
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is an optional extra
+    _HAS_NUMPY = False
+else:
+    _HAS_NUMPY = True
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
 
 UserId = NewType("UserId", int)
 
+# Matrices with more elements than this are summarised by ``str()``, keeping
+# this many leading and trailing rows and columns (NumPy's print defaults).
+_PRINT_THRESHOLD = 1000
+_PRINT_EDGE_ITEMS = 3
+
+# Element-wise operations on smaller matrices than this stay in pure Python,
+# where a comprehension beats the fixed cost of setting up NumPy views.
+_NUMPY_MIN_ELEMENTS = 64
+
 
 @dataclass(frozen=True, slots=True)
 class User:
@@ -58,18 +78,22 @@ class User:
         return f"{self.first_name} {self.last_name}".strip()
 
 
-@dataclass(frozen=True, slots=True)
 class Matrix:
     """Represents a mathematical matrix.
     
-    This is an immutable dataclass that stores matrix data as a list of lists.
     The matrix supports basic mathematical operations like addition, multiplication,
     and scalar operations.
     
+    Matrix elements are stored in a single contiguous row-major ``array('d')``
+    buffer, so element ``(i, j)`` lives at ``i * cols + j``. The nested-list
+    form is still accepted on construction and available through the ``data``
+    property. Matrices are immutable by convention: no method modifies an
+    existing instance, and ``__slots__`` keeps instances small.
+    
     Attributes:
-        data: 2D list representing the matrix elements
         rows: Number of rows in the matrix
         cols: Number of columns in the matrix
+        data: 2D list view of the matrix elements (built on access)
         
     Example:
         >>> matrix = Matrix([[1, 2], [3, 4]])
@@ -79,39 +103,182 @@ class Matrix:
         [3, 4]
     """
     
-    data: list[list[float]]
+    __slots__ = ("rows", "cols", "_flat")
     
-    def __post_init__(self) -> None:
-        """Validate matrix data after initialization."""
-        if not self.data:
+    rows: int
+    cols: int
+    _flat: array[float]
+    
+    def __init__(self, data: list[list[float]]) -> None:
+        """Validate and flatten the nested matrix data.
+        
+        Args:
+            data: 2D list representing the matrix elements
+            
+        Raises:
+            ValueError: If the data is empty or the rows have different lengths
+        """
+        if len(data) == 0 or len(data[0]) == 0:
             raise ValueError("Matrix cannot be empty")
         
-        # Check if all rows have the same length
-        first_row_length = len(self.data[0])
-        for row in self.data:
-            if len(row) != first_row_length:
+        # Flatten row by row, checking that all rows have the same length
+        cols = len(data[0])
+        flat: array[float] = array("d")
+        for row in data:
+            if len(row) != cols:
                 raise ValueError("All rows must have the same length")
+            flat.extend(row)
+        
+        self.rows = len(data)
+        self.cols = cols
+        self._flat = flat
     
-    @property
-    def rows(self) -> int:
-        """Get the number of rows in the matrix."""
-        return len(self.data)
+    @classmethod
+    def _from_flat(cls, flat: array[float], rows: int, cols: int) -> Matrix:
+        """Wrap an existing row-major buffer without copying or validating it."""
+        matrix = cls.__new__(cls)
+        matrix.rows = rows
+        matrix.cols = cols
+        matrix._flat = flat
+        return matrix
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare matrices by shape and element values."""
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.rows == other.rows and self.cols == other.cols and self._flat == other._flat
+    
+    # Matrices compare by value but are not frozen, so they are unhashable
+    __hash__ = None  # type: ignore[assignment]
+    
+    def _as_ndarray(self) -> npt.NDArray[np.float64]:
+        """Return a zero-copy 2D NumPy view of the flat buffer (requires NumPy)."""
+        return _ndarray_view(self._flat, self.rows, self.cols)
+    
+    @classmethod
+    def from_numpy(cls, array_like: npt.ArrayLike) -> Matrix:
+        """Create a matrix from a 2D NumPy array (or anything NumPy accepts).
+        
+        The values are copied into the matrix buffer with a single
+        ``numpy.copyto`` call, without going through nested Python lists.
+        
+        Args:
+            array_like: A 2D array of boolean, integer or real values
+            
+        Returns:
+            A new Matrix holding a float64 copy of the values
+            
+        Raises:
+            ImportError: If NumPy is not installed
+            TypeError: If the values cannot be cast to float64 without
+                changing their kind (e.g. complex numbers or strings)
+            ValueError: If the array is empty or not 2-dimensional
+        """
+        _require_numpy("Matrix.from_numpy()")
+        source = np.asarray(array_like)
+        if source.ndim != 2:
+            raise ValueError(f"Matrix data must be 2-dimensional, got {source.ndim} dimension(s)")
+        if source.size == 0:
+            raise ValueError("Matrix cannot be empty")
+        
+        rows, cols = source.shape
+        flat = _zeros(rows * cols)
+        np.copyto(_ndarray_view(flat, rows, cols), source, casting="same_kind")
+        return cls._from_flat(flat, rows, cols)
+    
+    def to_numpy(self) -> npt.NDArray[np.float64]:
+        """Return a read-only 2D NumPy view of the matrix elements.
+        
+        The view shares memory with the matrix, so no data is copied; call
+        ``.copy()`` on the result to get a writable array.
+        
+        Raises:
+            ImportError: If NumPy is not installed
+            
+        Example:
+            >>> Matrix([[1, 2], [3, 4]]).to_numpy()
+            array([[1., 2.],
+                   [3., 4.]])
+        """
+        _require_numpy("Matrix.to_numpy()")
+        view = self._as_ndarray()
+        view.flags.writeable = False
+        return view
+    
+    def __array__(self, dtype: npt.DTypeLike | None = None, copy: bool | None = None) -> npt.NDArray[Any]:
+        """Support ``numpy.asarray(matrix)`` without copying when possible.
+        
+        Raises:
+            ValueError: If ``copy=False`` but ``dtype`` requires a cast
+        """
+        view = self.to_numpy()
+        if dtype is not None and np.dtype(dtype) != view.dtype:
+            if copy is False:
+                raise ValueError(f"Unable to avoid copy while casting Matrix elements to {np.dtype(dtype)}")
+            return view.astype(dtype)
+        return view.copy() if copy else view
+    
+    def contract(self, subscripts: str, *others: Matrix) -> Matrix:
+        """Evaluate an Einstein-summation contraction of this and other matrices.
+        
+        Forwards to ``numpy.einsum`` with ``optimize="greedy"``, so variants
+        such as ``A·Bᵀ`` or ``AᵀA`` and chained products run as a single
+        BLAS-backed call without materialising transposed copies.
+        
+        Args:
+            subscripts: An ``einsum`` subscript string with one operand term
+                for this matrix followed by one per matrix in ``others``
+            *others: The remaining operands, in subscript order
+            
+        Returns:
+            A new Matrix holding the contraction result
+            
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the subscripts do not describe a 2-dimensional result
+            
+        Example:
+            >>> a = Matrix([[1, 2], [3, 4]])
+            >>> b = Matrix([[5, 6], [7, 8]])
+            >>> print(a.contract("ik,jk->ij", b))
+            Matrix(2x2):
+            [17, 23]
+            [39, 53]
+        """
+        _require_numpy("Matrix.contract()")
+        operands = [self._as_ndarray(), *(other._as_ndarray() for other in others)]
+        return Matrix.from_numpy(np.einsum(subscripts, *operands, optimize="greedy"))
     
     @property
-    def cols(self) -> int:
-        """Get the number of columns in the matrix."""
-        return len(self.data[0]) if self.data else 0
+    def data(self) -> list[list[float]]:
+        """Get the matrix elements as a list of row lists."""
+        flat, cols = self._flat, self.cols
+        return [flat[start:start + cols].tolist() for start in range(0, self.rows * cols, cols)]
     
     def __str__(self) -> str:
-        """String representation of the matrix."""
-        lines = [f"Matrix({self.rows}x{self.cols}):"]
-        for row in self.data:
-            lines.append(str(row))
+        """String representation of the matrix.
+        
+        Matrices with more than ``_PRINT_THRESHOLD`` elements are summarised
+        like NumPy arrays: only the first and last ``_PRINT_EDGE_ITEMS`` rows
+        and columns are shown, with ``...`` in between.
+        """
+        flat, rows, cols = self._flat, self.rows, self.cols
+        summarise = rows * cols > _PRINT_THRESHOLD
+        starts = range(0, rows * cols, cols)
+        lines = [f"Matrix({rows}x{cols}):"]
+        if summarise and rows > 2 * _PRINT_EDGE_ITEMS:
+            lines.extend(_format_row(flat[start:start + cols], summarise) for start in starts[:_PRINT_EDGE_ITEMS])
+            lines.append("...")
+            lines.extend(_format_row(flat[start:start + cols], summarise) for start in starts[-_PRINT_EDGE_ITEMS:])
+        else:
+            lines.extend(_format_row(flat[start:start + cols], summarise) for start in starts)
         return "\n".join(lines)
     
     def __repr__(self) -> str:
         """Detailed representation of the matrix."""
-        return f"Matrix({self.data})"
+        flat, cols = self._flat, self.cols
+        rows = ", ".join(_format_row(flat[start:start + cols]) for start in range(0, self.rows * cols, cols))
+        return f"Matrix([{rows}])"
     
     def get_element(self, row: int, col: int) -> float:
         """Get element at specified position.
@@ -126,11 +293,12 @@ class Matrix:
         Raises:
             IndexError: If row or col is out of bounds
         """
-        if not (0 <= row < self.rows):
-            raise IndexError(f"Row index {row} out of bounds (0-{self.rows-1})")
-        if not (0 <= col < self.cols):
-            raise IndexError(f"Column index {col} out of bounds (0-{self.cols-1})")
-        return self.data[row][col]
+        rows, cols = self.rows, self.cols
+        if not (0 <= row < rows):
+            raise IndexError(f"Row index {row} out of bounds (0-{rows-1})")
+        if not (0 <= col < cols):
+            raise IndexError(f"Column index {col} out of bounds (0-{cols-1})")
+        return self._flat[row * cols + col]
     
     def transpose(self) -> Matrix:
         """Return the transpose of the matrix.
@@ -138,8 +306,13 @@ class Matrix:
         Returns:
             A new Matrix object that is the transpose of this matrix
         """
-        transposed_data = [[self.data[j][i] for j in range(self.rows)] for i in range(self.cols)]
-        return Matrix(transposed_data)
+        flat, cols = self._flat, self.cols
+        # Column j of this matrix is the strided slice flat[j::cols] and
+        # becomes row j of the transpose; each slice is gathered in C.
+        transposed: array[float] = array("d")
+        for j in range(cols):
+            transposed.extend(flat[j::cols])
+        return Matrix._from_flat(transposed, cols, self.rows)
     
     def __add__(self, other: Matrix) -> Matrix:
         """Add two matrices element-wise.
@@ -156,11 +329,12 @@ class Matrix:
         if self.rows != other.rows or self.cols != other.cols:
             raise ValueError(f"Cannot add matrices of different sizes: {self.rows}x{self.cols} and {other.rows}x{other.cols}")
         
-        result_data = [
-            [self.data[i][j] + other.data[i][j] for j in range(self.cols)]
-            for i in range(self.rows)
-        ]
-        return Matrix(result_data)
+        if _HAS_NUMPY and len(self._flat) >= _NUMPY_MIN_ELEMENTS:
+            result = _zeros(len(self._flat))
+            np.add(self._as_ndarray(), other._as_ndarray(), out=_ndarray_view(result, self.rows, self.cols))
+        else:
+            result = array("d", [x + y for x, y in zip(self._flat, other._flat)])
+        return Matrix._from_flat(result, self.rows, self.cols)
     
     def __mul__(self, scalar: float) -> Matrix:
         """Multiply matrix by a scalar.
@@ -171,12 +345,89 @@ class Matrix:
         Returns:
             A new Matrix with all elements multiplied by the scalar
         """
-        result_data = [
-            [self.data[i][j] * scalar for j in range(self.cols)]
-            for i in range(self.rows)
-        ]
-        return Matrix(result_data)
+        if _HAS_NUMPY and len(self._flat) >= _NUMPY_MIN_ELEMENTS:
+            result = _zeros(len(self._flat))
+            np.multiply(self._as_ndarray(), scalar, out=_ndarray_view(result, self.rows, self.cols))
+        else:
+            result = array("d", [x * scalar for x in self._flat])
+        return Matrix._from_flat(result, self.rows, self.cols)
     
     def __rmul__(self, scalar: float) -> Matrix:
         """Right multiplication by scalar (scalar * matrix)."""
         return self * scalar
+    
+    def axpy(self, other: Matrix, alpha: float) -> Matrix:
+        """Compute ``self + alpha * other`` without a scaled temporary.
+        
+        Equivalent to ``self + other * alpha`` but without allocating the
+        scaled intermediate matrix. The pure-Python path computes each element
+        in a single pass; the NumPy path scales ``other`` into the result
+        buffer and then adds ``self`` in place, so it makes two passes over
+        that one buffer.
+        
+        Args:
+            other: The matrix to scale and add
+            alpha: The scalar to multiply ``other`` by
+            
+        Returns:
+            A new Matrix holding ``self + alpha * other``
+            
+        Raises:
+            ValueError: If matrices have different dimensions
+            
+        Example:
+            >>> a = Matrix([[1, 2], [3, 4]])
+            >>> b = Matrix([[5, 6], [7, 8]])
+            >>> print(a.axpy(b, 2))
+            Matrix(2x2):
+            [11, 14]
+            [17, 20]
+        """
+        if self.rows != other.rows or self.cols != other.cols:
+            raise ValueError(f"Cannot add matrices of different sizes: {self.rows}x{self.cols} and {other.rows}x{other.cols}")
+        
+        if _HAS_NUMPY and len(self._flat) >= _NUMPY_MIN_ELEMENTS:
+            result = _zeros(len(self._flat))
+            out = _ndarray_view(result, self.rows, self.cols)
+            np.multiply(other._as_ndarray(), alpha, out=out)
+            np.add(out, self._as_ndarray(), out=out)
+        else:
+            result = array("d", [x + alpha * y for x, y in zip(self._flat, other._flat)])
+        return Matrix._from_flat(result, self.rows, self.cols)
+
+
+def _format_element(value: float) -> str:
+    """Format a stored element, printing integral values without a trailing ``.0``."""
+    return repr(value).removesuffix(".0")
+
+
+def _format_row(row: array[float], summarise: bool = False) -> str:
+    """Format one row of elements as a bracketed, comma-separated list.
+    
+    With ``summarise`` set, rows longer than twice ``_PRINT_EDGE_ITEMS`` keep
+    only their leading and trailing elements around a ``...`` marker.
+    """
+    if summarise and len(row) > 2 * _PRINT_EDGE_ITEMS:
+        items = [*map(_format_element, row[:_PRINT_EDGE_ITEMS]), "...", *map(_format_element, row[-_PRINT_EDGE_ITEMS:])]
+        return f"[{', '.join(items)}]"
+    return f"[{', '.join(map(_format_element, row))}]"
+
+
+def _require_numpy(feature: str) -> None:
+    """Raise an informative ImportError if the optional NumPy extra is missing."""
+    if not _HAS_NUMPY:
+        raise ImportError(f"{feature} requires NumPy; install the 'numpy' extra")
+
+
+def _zeros(size: int) -> array[float]:
+    """Allocate a zero-filled ``array('d')`` buffer of the given length."""
+    return array("d", [0.0]) * size
+
+
+def _ndarray_view(flat: array[float], rows: int, cols: int) -> npt.NDArray[np.float64]:
+    """View a row-major ``array('d')`` buffer as a 2D NumPy array without copying.
+    
+    Writes through the view land in ``flat``, which lets NumPy kernels fill a
+    freshly allocated result buffer directly via their ``out=`` argument.
+    """
+    return np.frombuffer(flat, dtype=np.float64).reshape(rows, cols)
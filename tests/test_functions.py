@@ -0,0 +1,32 @@
+"""Tests for the non-matrix utility functions.
+
+This module covers calculate_total across the kinds of input it accepts,
+including sums that lose precision under naive floating-point addition.
+"""
+
+import pytest
+from src.typed_app.functions import calculate_total
+
+
+class TestCalculateTotal:
+    """Test cases for calculate_total."""
+    
+    def test_list(self):
+        """Test summing a list of prices."""
+        assert calculate_total([9.99, 4.50, 2.00]) == pytest.approx(16.49)
+        assert calculate_total([]) == 0.0
+    
+    def test_generator(self):
+        """Test summing a one-shot iterable."""
+        assert calculate_total(price * 2 for price in [1.25, 2.5]) == 7.5
+    
+    def test_cancellation(self):
+        """Test that large cancelling terms do not swallow small ones."""
+        assert calculate_total([1e16, 1.0, -1e16]) == 1.0
+        assert calculate_total([0.1] * 10) == 1.0
+    
+    def test_ndarray(self):
+        """Test that NumPy arrays are summed as exactly as lists."""
+        np = pytest.importorskip("numpy")
+        assert calculate_total(np.array([1e16, 1.0, -1e16])) == 1.0
+        assert calculate_total(np.array([[1.5, 2.5], [3.0, 4.0]])) == 11.0
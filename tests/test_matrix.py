@@ -4,7 +4,11 @@ This module contains comprehensive tests for the Matrix class and matrix-related
 functions to ensure they work correctly and handle edge cases properly.
 """
 
+from array import array
+
 import pytest
+from src.typed_app import functions, models
+from src.typed_app._kernels import determinant_gauss, matmul_dot, matmul_unrolled
 from src.typed_app.models import Matrix
 from src.typed_app.functions import (
     multiply_matrices,
@@ -29,12 +33,25 @@ class TestMatrix:
         """Test that empty matrix creation raises ValueError."""
         with pytest.raises(ValueError, match="Matrix cannot be empty"):
             Matrix([])
+        with pytest.raises(ValueError, match="Matrix cannot be empty"):
+            Matrix([[]])
     
     def test_matrix_creation_inconsistent_rows(self):
         """Test that inconsistent row lengths raise ValueError."""
         with pytest.raises(ValueError, match="All rows must have the same length"):
             Matrix([[1, 2], [3]])
     
+    def test_matrix_equality(self):
+        """Test that matrices compare equal by shape and element values."""
+        assert Matrix([[1, 2], [3, 4]]) == Matrix([[1.0, 2.0], [3.0, 4.0]])
+        assert Matrix([[1, 2, 3, 4]]) != Matrix([[1, 2], [3, 4]])
+    
+    def test_data_returns_row_lists(self):
+        """Test that the nested data view is rebuilt from row-major storage."""
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+        assert matrix.data == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        assert matrix.get_element(1, 0) == 4
+    
     def test_get_element(self):
         """Test getting elements from matrix."""
         matrix = Matrix([[1, 2, 3], [4, 5, 6]])
@@ -94,6 +111,92 @@ class TestMatrix:
         expected = Matrix([[3, 6], [9, 12]])
         assert result.data == expected.data
     
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_elementwise_backends(self, monkeypatch, use_numpy):
+        """Test addition and scalar multiplication on both backends."""
+        if use_numpy:
+            monkeypatch.setattr(models, "_NUMPY_MIN_ELEMENTS", 0)
+        else:
+            monkeypatch.setattr(models, "_HAS_NUMPY", False)
+        a = Matrix([[1, 2, 3], [4, 5, 6]])
+        b = Matrix([[0.5, 0, -1], [2, 2, 2]])
+        
+        assert a + b == Matrix([[1.5, 2, 2], [6, 7, 8]])
+        assert a * -1.5 == Matrix([[-1.5, -3, -4.5], [-6, -7.5, -9]])
+    
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_axpy(self, monkeypatch, use_numpy):
+        """Test fused scale-and-add against separate operations."""
+        if use_numpy:
+            monkeypatch.setattr(models, "_NUMPY_MIN_ELEMENTS", 0)
+        else:
+            monkeypatch.setattr(models, "_HAS_NUMPY", False)
+        a = Matrix([[1, 2], [3, 4]])
+        b = Matrix([[5, 6], [7, 8]])
+        
+        assert a.axpy(b, 2) == a + b * 2
+        assert a.axpy(b, 0.5) == Matrix([[3.5, 5], [6.5, 8]])
+    
+    def test_axpy_different_sizes(self):
+        """Test that axpy with mismatched sizes raises ValueError."""
+        with pytest.raises(ValueError, match="Cannot add matrices of different sizes"):
+            Matrix([[1, 2]]).axpy(Matrix([[1], [2]]), 1.0)
+    
+    def test_numpy_round_trip(self):
+        """Test zero-copy export to NumPy and construction from an ndarray."""
+        np = pytest.importorskip("numpy")
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+        view = matrix.to_numpy()
+        
+        assert np.array_equal(view, np.array([[1, 2, 3], [4, 5, 6]]))
+        assert not view.flags.writeable
+        assert np.shares_memory(np.asarray(matrix), view)
+        # Non-contiguous integer input is copied into float64 storage
+        assert Matrix.from_numpy(np.arange(1, 7).reshape(2, 3).T) == matrix.transpose()
+    
+    def test_array_protocol_copy(self):
+        """Test that __array__ honours NumPy's copy and dtype arguments."""
+        np = pytest.importorskip("numpy", minversion="2.0")
+        matrix = Matrix([[1, 2], [3, 4]])
+        
+        assert np.shares_memory(np.asarray(matrix, copy=False), matrix.to_numpy())
+        assert not np.shares_memory(np.array(matrix, copy=True), matrix.to_numpy())
+        assert np.asarray(matrix, dtype=np.float32).dtype == np.float32
+        with pytest.raises(ValueError, match="Unable to avoid copy"):
+            np.asarray(matrix, dtype=np.float32, copy=False)
+    
+    def test_from_numpy_invalid_shape(self):
+        """Test that non-2D or empty arrays are rejected."""
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="must be 2-dimensional"):
+            Matrix.from_numpy(np.zeros(3))
+        with pytest.raises(ValueError, match="Matrix cannot be empty"):
+            Matrix.from_numpy(np.zeros((0, 2)))
+        with pytest.raises(ValueError, match="Matrix cannot be empty"):
+            Matrix.from_numpy(np.zeros((2, 0)))
+    
+    def test_from_numpy_rejects_non_real_values(self):
+        """Test that complex and string arrays are not silently converted."""
+        np = pytest.importorskip("numpy")
+        assert Matrix.from_numpy(np.array([[True, False]])) == Matrix([[1, 0]])
+        assert Matrix.from_numpy(np.array([[1, 2]], dtype=np.float32)) == Matrix([[1, 2]])
+        with pytest.raises(TypeError, match="Cannot cast"):
+            Matrix.from_numpy([[1 + 2j, 3]])
+        with pytest.raises(TypeError, match="Cannot cast"):
+            Matrix.from_numpy([["1.5", "2"]])
+    
+    def test_contract(self):
+        """Test einsum contractions against the explicit operations."""
+        pytest.importorskip("numpy")
+        a = Matrix([[1, 2, 3], [4, 5, 6]])
+        b = Matrix([[7, 8], [9, 10], [11, 12]])
+        
+        assert a.contract("ik,kj->ij", b) == multiply_matrices(a, b)
+        assert a.contract("ik,jk->ij", b.transpose()) == multiply_matrices(a, b)
+        assert a.contract("ki,kj->ij", a) == multiply_matrices(a.transpose(), a)
+        with pytest.raises(ValueError, match="must be 2-dimensional"):
+            a.contract("ij->i")
+    
     def test_string_representation(self):
         """Test matrix string representation."""
         matrix = Matrix([[1, 2], [3, 4]])
@@ -102,6 +205,21 @@ class TestMatrix:
         expected = "Matrix(2x2):\n[1, 2]\n[3, 4]"
         assert str_repr == expected
     
+    def test_string_representation_summarised(self):
+        """Test that large matrices print only their edge rows and columns."""
+        matrix = Matrix([[float(i * 40 + j) for j in range(40)] for i in range(40)])
+        lines = str(matrix).split("\n")
+        
+        assert lines[0] == "Matrix(40x40):"
+        assert lines[1] == "[0, 1, 2, ..., 37, 38, 39]"
+        assert lines[4] == "..."
+        assert lines[-1] == "[1560, 1561, 1562, ..., 1597, 1598, 1599]"
+        assert len(lines) == 8
+    
+    def test_string_representation_float_elements(self):
+        """Test that non-integral, huge and negative-zero elements print as floats."""
+        assert repr(Matrix([[1.0, 2.5], [1e300, -0.0]])) == "Matrix([[1, 2.5], [1e+300, -0]])"
+    
     def test_repr_representation(self):
         """Test matrix repr representation."""
         matrix = Matrix([[1, 2], [3, 4]])
@@ -123,6 +241,56 @@ class TestMatrixFunctions:
         expected = Matrix([[19, 22], [43, 50]])
         assert result.data == expected.data
     
+    def test_multiply_matrices_non_square(self):
+        """Test multiplying a 2x3 matrix by a 3x2 matrix."""
+        matrix1 = Matrix([[1, 2, 3], [4, 5, 6]])
+        matrix2 = Matrix([[7, 8], [9, 10], [11, 12]])
+        result = multiply_matrices(matrix1, matrix2)
+        
+        assert result == Matrix([[58, 64], [139, 154]])
+    
+    @pytest.mark.parametrize("backend", ["numpy", "python"])
+    def test_multiply_matrices_backends(self, monkeypatch, backend):
+        """Test that the fallback multiplication backends match the default one."""
+        matrix1 = Matrix([[1, 2, 3], [4, 5, 6]])
+        matrix2 = Matrix([[7, 8], [9, 10], [11, 12]])
+        expected = multiply_matrices(matrix1, matrix2)
+        
+        monkeypatch.setattr(functions, "UNROLL_MAX_WORK", 0)
+        if backend == "python":
+            monkeypatch.setattr(functions, "_HAS_NUMPY", False)
+        assert multiply_matrices(matrix1, matrix2) == expected
+    
+    @pytest.mark.parametrize("shape", [(1, 1, 1), (2, 2, 2), (2, 3, 2), (4, 1, 3), (4, 4, 4)])
+    def test_multiply_matrices_unrolled(self, shape):
+        """Test the generated straight-line kernels against the dot-product kernel."""
+        m, k, n = shape
+        a = Matrix([[float(i * k + p + 1) for p in range(k)] for i in range(m)])
+        b = Matrix([[float(p - j) / 2 for j in range(n)] for p in range(k)])
+        
+        result = multiply_matrices(a, b)
+        assert result == Matrix._from_flat(matmul_dot(a._flat, b._flat, m, k, n), m, n)
+        assert matmul_unrolled(m, k, n) is matmul_unrolled(m, k, n)
+    
+    @pytest.mark.parametrize("shape", [(1, 1, 0), (0, 2, 2), (2, 0, 2)])
+    def test_matmul_unrolled_empty_shapes(self, shape):
+        """Test that degenerate shapes still generate valid kernels."""
+        m, k, n = shape
+        kernel = matmul_unrolled(m, k, n)
+        assert kernel(array("d", [1.0]) * (m * k), array("d", [1.0]) * (k * n)) == array("d", [0.0]) * (m * n)
+    
+    def test_multiply_matrices_large(self):
+        """Test a product too large for the generated straight-line kernels."""
+        size = 70
+        data = [[float((i * size + j) % 7) for j in range(size)] for i in range(size)]
+        result = multiply_matrices(Matrix(data), Matrix(data))
+        
+        expected = [
+            [sum(data[i][k] * data[k][j] for k in range(size)) for j in range(size)]
+            for i in range(size)
+        ]
+        assert result.data == expected
+    
     def test_multiply_matrices_incompatible_sizes(self):
         """Test matrix multiplication with incompatible sizes."""
         matrix1 = Matrix([[1, 2], [3, 4]])
@@ -166,6 +334,28 @@ class TestMatrixFunctions:
         det = matrix_determinant(matrix)
         assert det == 0.0  # This matrix has determinant 0
     
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_matrix_determinant_4x4(self, monkeypatch, use_numpy):
+        """Test determinant calculation for 4x4 matrix on both backends."""
+        if not use_numpy:
+            monkeypatch.setattr(functions, "_HAS_NUMPY", False)
+        matrix = Matrix([[2, 0, 1, 3], [1, 1, 0, 2], [0, 3, 1, 1], [4, 1, 2, 0]])
+        det = matrix_determinant(matrix)
+        assert det == pytest.approx(-32.0)
+    
+    def test_matrix_determinant_gauss_pivoting(self):
+        """Test the pure-Python elimination with zero pivots and singular input."""
+        # A zero in the leading position forces a row swap
+        assert determinant_gauss(Matrix([[0, 2, 1], [1, 0, 0], [0, 0, 3]])._flat, 3) == pytest.approx(-6.0)
+        assert determinant_gauss(Matrix([[1, 2, 3], [2, 4, 6], [7, 8, 9]])._flat, 3) == 0.0
+        # Singular, but the elimination leaves a rounding residue in the last pivot
+        assert determinant_gauss(Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])._flat, 3) == pytest.approx(0.0, abs=1e-12)
+    
+    def test_matrix_determinant_3x3_exact(self):
+        """Test that the 3x3 closed form is exact for integer input."""
+        assert matrix_determinant(Matrix([[2, 0, 0], [0, 3, 0], [0, 0, 4]])) == 24.0
+        assert matrix_determinant(Matrix([[0, 2, 1], [1, 0, 0], [0, 0, 3]])) == -6.0
+    
     def test_matrix_determinant_non_square(self):
         """Test that determinant calculation for non-square matrix raises ValueError."""
         matrix = Matrix([[1, 2, 3], [4, 5, 6]])
@@ -200,8 +390,11 @@ class TestMatrixIntegration:
         # Test: A + B, then multiply by 2, then add identity
         result = (a + b) * 2 + identity
         
-        expected = Matrix([[7, 10], [13, 19]])  # (A+B)*2 + I
+        expected = Matrix([[7, 4], [8, 15]])  # (A+B)*2 + I
         assert result.data == expected.data
+        
+        # The same chain with the scale-and-add fused: I + 2 * (A + B)
+        assert identity.axpy(a + b, 2) == expected
     
     def test_determinant_and_trace_relationship(self):
         """Test that determinant and trace work correctly together."""